@@ -6,6 +6,7 @@ from src.logger import logging  # Logging module for tracking
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from dataclasses import dataclass  # For creating configuration classes
+from src.utils import COMPACT_DTYPES, dataframe_memory_report
 
 # Import data transformation and model training components
 from src.components.data_transformation import DataTransformation, DataTransformationConfig
@@ -18,12 +19,16 @@ class DataIngestionConfig:
     train_data_path: str = os.path.join('artifacts', "train.csv")
     test_data_path: str = os.path.join('artifacts', "test.csv")
     raw_data_path: str = os.path.join('artifacts', "data.csv")
+    # Read categoricals as pandas categories and scores as nullable Int8
+    compact_dtypes: bool = False
 
 # Main class responsible for data ingestion
 class DataIngestion:
     def __init__(self):
         # Initialize with the configuration class
         self.ingestion_config = DataIngestionConfig()
+        # Filled with default vs compact memory usage when compact_dtypes is enabled
+        self.memory_report = {}
 
     def initiate_data_ingestion(self):
         """
@@ -36,7 +41,12 @@ class DataIngestion:
         logging.info("Entered the data ingestion method or component")
         try:
             # Read source data from CSV
-            df = pd.read_csv('notebook/data/stud.csv')
+            if self.ingestion_config.compact_dtypes:
+                df = pd.read_csv('notebook/data/stud.csv', dtype=COMPACT_DTYPES)
+                self.memory_report = {"ingestion": dataframe_memory_report(df)}
+                logging.info(f"Ingestion memory (compact dtypes): {self.memory_report}")
+            else:
+                df = pd.read_csv('notebook/data/stud.csv')
             logging.info('Read the dataset as dataframe')
 
             # Create directory structure if it doesn't exist
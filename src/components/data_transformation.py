@@ -6,30 +6,43 @@ import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, StandardScaler
 from src.exception import CustomException  # Custom exception handling
 from src.logger import logging  # Logging module for tracking
 import os
 from src.utils import save_object  # Utility function to save Python objects
+from src.utils import COMPACT_DTYPES, dataframe_memory_report
 
 # Configuration class for data transformation paths using dataclass
 @dataclass
 class DataTransformationConfig:
     # Default path for saving preprocessing object (serialized pipeline)
     preprocessor_obj_file_path = os.path.join('artifacts', "preprocessor.pkl")
+    # Read with compact dtypes and return float32 arrays instead of float64
+    compact_dtypes: bool = False
+
+def to_float32(X):
+    """Casts numeric input (including nullable Int8 with NA) to float32"""
+    return X.astype(np.float32)
 
 class DataTransformation:
     def __init__(self):
         # Initialize with configuration class
         self.data_transformation_config = DataTransformationConfig()
+        # Filled with default vs compact memory usage when compact_dtypes is enabled
+        self.memory_report = {}
 
     def get_data_transformer_object(self):
         '''
         Creates and returns a preprocessing pipeline that handles:
         - Numerical columns: Imputation + Scaling
         - Categorical columns: Imputation + Encoding + Scaling
+        In compact mode every step works in float32, so the transformed
+        matrix is produced as float32 instead of being cast afterwards.
         '''
         try:
+            compact = self.data_transformation_config.compact_dtypes
+
             # Define column types
             numerical_columns = ["writing_score", "reading_score"]
             categorical_columns = [
@@ -41,14 +54,16 @@ class DataTransformation:
             ]
 
             # Numerical data processing pipeline
-            num_pipeline = Pipeline(
-                steps=[
-                    # Handle missing values with median imputation
-                    ("imputer", SimpleImputer(strategy="median")),
-                    # Standardize features by removing mean and scaling to unit variance
-                    ("scaler", StandardScaler())
-                ]
-            )
+            num_steps = [
+                # Handle missing values with median imputation
+                ("imputer", SimpleImputer(strategy="median")),
+                # Standardize features by removing mean and scaling to unit variance
+                ("scaler", StandardScaler())
+            ]
+            if compact:
+                # Imputer and scaler preserve float32 input
+                num_steps.insert(0, ("to_float32", FunctionTransformer(to_float32)))
+            num_pipeline = Pipeline(steps=num_steps)
 
             # Categorical data processing pipeline
             cat_pipeline = Pipeline(
@@ -56,7 +71,7 @@ class DataTransformation:
                     # Replace missing values with most frequent category
                     ("imputer", SimpleImputer(strategy="most_frequent")),
                     # Convert categorical variables to one-hot numeric arrays
-                    ("one_hot_encoder", OneHotEncoder()),
+                    ("one_hot_encoder", OneHotEncoder(dtype=np.float32 if compact else np.float64)),
                     # Scale without centering to preserve sparsity
                     ("scaler", StandardScaler(with_mean=False))
                 ]
@@ -89,8 +104,9 @@ class DataTransformation:
         '''
         try:
             # Load raw data from provided paths
-            train_df = pd.read_csv(train_path)
-            test_df = pd.read_csv(test_path)
+            compact = self.data_transformation_config.compact_dtypes
+            train_df = pd.read_csv(train_path, dtype=COMPACT_DTYPES if compact else None)
+            test_df = pd.read_csv(test_path, dtype=COMPACT_DTYPES if compact else None)
 
             logging.info("Read train and test data completed")
 
@@ -102,10 +118,10 @@ class DataTransformation:
             numerical_columns = ["writing_score", "reading_score"]  # Used for validation
 
             # Split data into features (X) and target (y)
-            input_feature_train_df = train_df.drop(columns=[target_column_name], axis=1)
+            input_feature_train_df = train_df.drop(columns=[target_column_name])
             target_feature_train_df = train_df[target_column_name]
 
-            input_feature_test_df = test_df.drop(columns=[target_column_name], axis=1)
+            input_feature_test_df = test_df.drop(columns=[target_column_name])
             target_feature_test_df = test_df[target_column_name]
 
             logging.info("Applying preprocessing object on dataframes")
@@ -115,6 +131,11 @@ class DataTransformation:
             input_feature_train_arr = preprocessing_obj.fit_transform(input_feature_train_df)
             input_feature_test_arr = preprocessing_obj.transform(input_feature_test_df)
 
+            # Compact mode: features are already float32; match the target so np.c_ does not promote
+            if compact:
+                target_feature_train_df = target_feature_train_df.astype(np.float32)
+                target_feature_test_df = target_feature_test_df.astype(np.float32)
+
             # Combine processed features with target values
             train_arr = np.c_[
                 input_feature_train_arr,  # Processed features
@@ -125,6 +146,21 @@ class DataTransformation:
                 np.array(target_feature_test_df)
             ]
 
+            if compact:
+                # Final train+test array sizes: float32 as produced vs the same shape in float64
+                float64_bytes = (train_arr.size + test_arr.size) * np.dtype(np.float64).itemsize
+                float32_bytes = train_arr.nbytes + test_arr.nbytes
+                self.memory_report = {
+                    "transformation_train": dataframe_memory_report(train_df),
+                    "transformation_test": dataframe_memory_report(test_df),
+                    "final_feature_arrays": {
+                        "float64_bytes": float64_bytes,
+                        "float32_bytes": float32_bytes,
+                        "saving_ratio": float64_bytes / float32_bytes,
+                    },
+                }
+                logging.info(f"Transformation memory (compact dtypes): {self.memory_report}")
+
             # Save preprocessing object for future use (inference)
             save_object(
                 file_path=self.data_transformation_config.preprocessor_obj_file_path,
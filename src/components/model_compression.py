@@ -0,0 +1,301 @@
+# Import necessary libraries and modules
+import copy
+import json
+import os
+import pickle
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from catboost import CatBoostRegressor
+from sklearn.base import clone
+from sklearn.ensemble import (
+    AdaBoostRegressor,
+    GradientBoostingRegressor,
+    RandomForestRegressor,
+)
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeRegressor
+from xgboost import XGBRegressor
+
+# Custom modules
+from src.exception import CustomException
+from src.logger import logging
+from src.utils import save_object
+
+# Attributes that are only populated for training diagnostics and are never read by predict()
+TRAINING_ONLY_ATTRIBUTES = (
+    "oob_score_",
+    "oob_prediction_",
+    "oob_improvement_",
+    "oob_scores_",
+    "train_score_",
+    "estimator_errors_",
+    "singular_",
+    "rank_",
+)
+
+# Configuration class using dataclass decorator
+@dataclass
+class ModelCompressionConfig:
+    # Compressed model is written next to the original instead of replacing it
+    compressed_model_file_path: str = os.path.join("artifacts", "model_compressed.pkl")
+    # Before/after size, load time and latency report written next to the compressed model
+    compression_report_file_path: str = os.path.join("artifacts", "compression_report.json")
+    # Largest drop in validation R² we accept in exchange for a smaller/faster model
+    max_r2_loss: float = 0.005
+    # Share of the training data held out to choose the compression level; the
+    # test set is only used to report R² once the level is fixed
+    validation_size: float = 0.2
+    random_state: int = 42
+    # Number of repetitions used for the load time and latency measurements
+    timing_repeats: int = 20
+
+
+class ModelCompressor:
+    def __init__(self):
+        # Initialize with configuration settings
+        self.model_compression_config = ModelCompressionConfig()
+
+    def measure_model(self, model, X_test):
+        """
+        Measures the inference cost of a fitted model
+
+        Args:
+            model: Fitted estimator
+            X_test (numpy.ndarray): Features used for the latency measurements
+
+        Returns:
+            dict: Pickled artifact size in bytes, median load time, median
+                  single-row and batch predict latency (seconds)
+        """
+        repeats = self.model_compression_config.timing_repeats
+        payload = pickle.dumps(model)
+
+        # Load time of the serialized artifact
+        load_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            pickle.loads(payload)
+            load_times.append(time.perf_counter() - start)
+
+        # Single-row latency mirrors one /predictdata request, batch latency the test set
+        single_row = X_test[:1]
+        single_times, batch_times = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model.predict(single_row)
+            single_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            model.predict(X_test)
+            batch_times.append(time.perf_counter() - start)
+
+        return {
+            "artifact_size_bytes": len(payload),
+            "load_time_s": float(np.median(load_times)),
+            "predict_latency_single_s": float(np.median(single_times)),
+            "predict_latency_batch_s": float(np.median(batch_times)),
+        }
+
+    def initiate_model_compression(self, model, X_train, y_train, X_test, y_test):
+        """
+        Compresses the selected model within the allowed R² loss and saves it
+
+        Steps:
+        1. Refit a copy of the model on part of the training data and choose the
+           pruning strength (single trees) or ensemble size on the held-out rest
+        2. Apply that level to the model, converting float64 parameters to float32
+           where the estimator supports it and the validation budget allows
+        3. Drop training-only attributes
+        4. Report test R², size, load time and latency before and after
+
+        Args:
+            model: Fitted best model from ModelTrainer
+            X_train (numpy.ndarray): Training features (split for level selection
+                and used to refit pruned trees)
+            y_train (numpy.ndarray): Training target
+            X_test (numpy.ndarray): Testing features, only used for reporting
+            y_test (numpy.ndarray): Testing target, only used for reporting
+
+        Returns:
+            dict: Compression report with the chosen level, validation and test R²
+                  and cost metrics before and after
+
+        Raises:
+            CustomException: If any error occurs during compression
+        """
+        try:
+            config = self.model_compression_config
+            logging.info(f"Compressing {type(model).__name__}")
+
+            # The fitted model has seen all of X_train, so selection uses a refit copy
+            X_fit, X_val, y_fit, y_val = train_test_split(
+                X_train, y_train, test_size=config.validation_size, random_state=config.random_state
+            )
+            selector = clone(model).fit(X_fit, y_fit)
+            validation_r2 = r2_score(y_val, selector.predict(X_val))
+            min_r2 = validation_r2 - config.max_r2_loss
+
+            # Size reduction within the allowed R² loss
+            level = {}
+            if isinstance(model, DecisionTreeRegressor):
+                level["ccp_alpha"], selected = _select_ccp_alpha(selector, X_fit, y_fit, X_val, y_val, min_r2)
+                compressed = clone(model).set_params(ccp_alpha=level["ccp_alpha"]).fit(X_train, y_train)
+            elif _ensemble_size(model) is not None:
+                level["n_stages"], selected = _select_ensemble_size(selector, X_val, y_val, min_r2)
+                compressed = _truncated_copy(model, min(level["n_stages"], _ensemble_size(model)))
+            else:
+                selected, compressed = copy.deepcopy(selector), copy.deepcopy(model)
+
+            # Float32 rounding must also respect the budget, otherwise keep float64 parameters
+            converted = _convert_to_float32(selected)
+            compressed_validation_r2 = r2_score(y_val, selected.predict(X_val))
+            level["float32"] = bool(converted and compressed_validation_r2 >= min_r2)
+            if level["float32"]:
+                _convert_to_float32(compressed)
+            elif converted:
+                logging.info("Float32 conversion exceeded the R² budget, keeping float64 parameters")
+                compressed_validation_r2 = r2_score(y_val, _restore_float64(selected, selector).predict(X_val))
+
+            _strip_training_attributes(compressed)
+
+            # Test R² is only measured now that the compression level is fixed
+            report = {
+                "model": type(model).__name__,
+                "level": level,
+                "validation_size": config.validation_size,
+                "validation_r2_before": validation_r2,
+                "validation_r2_after": compressed_validation_r2,
+                "baseline_r2": r2_score(y_test, model.predict(X_test)),
+                "compressed_r2": r2_score(y_test, compressed.predict(X_test)),
+                "n_estimators_before": _ensemble_size(model),
+                "n_estimators_after": _ensemble_size(compressed),
+                "before": self.measure_model(model, X_test),
+                "after": self.measure_model(compressed, X_test),
+            }
+
+            # Model Persistence
+            save_object(
+                file_path=config.compressed_model_file_path,
+                obj=compressed
+            )
+            logging.info(f"Saved compressed model to {config.compressed_model_file_path}")
+
+            with open(config.compression_report_file_path, "w") as file_obj:
+                json.dump(report, file_obj, indent=2, default=float)
+            logging.info(f"Compression report saved to {config.compression_report_file_path}: {report}")
+
+            return report
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+
+def _ensemble_size(model):
+    """Returns the number of fitted stages of an ensemble, or None for other models"""
+    if isinstance(model, (RandomForestRegressor, GradientBoostingRegressor, AdaBoostRegressor)):
+        return len(model.estimators_)
+    if isinstance(model, CatBoostRegressor):
+        return model.tree_count_
+    if isinstance(model, XGBRegressor):
+        return model.get_booster().num_boosted_rounds()
+    return None
+
+
+def _truncated_copy(model, n_stages):
+    """Returns a copy of an ensemble keeping only its first n_stages fitted stages"""
+    if isinstance(model, CatBoostRegressor):
+        truncated = model.copy()
+        truncated.shrink(ntree_end=n_stages)
+        return truncated
+
+    if isinstance(model, XGBRegressor):
+        # Booster slicing keeps the first n_stages rounds; reload into a fresh regressor
+        truncated = XGBRegressor()
+        truncated.load_model(bytearray(model.get_booster()[:n_stages].save_raw("ubj")))
+        truncated.set_params(n_estimators=n_stages)
+        return truncated
+
+    truncated = copy.copy(model)
+    truncated.estimators_ = model.estimators_[:n_stages]
+    truncated.n_estimators = n_stages
+    if isinstance(model, AdaBoostRegressor):
+        # Weighted median only reads the weights of the kept estimators
+        truncated.estimator_weights_ = model.estimator_weights_[:n_stages]
+        truncated.estimator_errors_ = model.estimator_errors_[:n_stages]
+    if isinstance(model, GradientBoostingRegressor):
+        truncated.train_score_ = model.train_score_[:n_stages]
+    return truncated
+
+
+def _select_ensemble_size(model, X_val, y_val, min_r2):
+    """
+    Returns the smallest number of stages whose validation R² stays above min_r2,
+    together with the truncated model
+    """
+    n_stages = _ensemble_size(model)
+
+    # Candidate sizes grow geometrically so large ensembles need few evaluations
+    candidates = sorted({max(1, int(n_stages / 2 ** i)) for i in range(int(np.log2(n_stages)) + 1)})
+    for size in candidates:
+        truncated = _truncated_copy(model, size)
+        score = r2_score(y_val, truncated.predict(X_val))
+        if score >= min_r2:
+            logging.info(f"Selected {size} of {n_stages} ensemble stages (validation R²: {score})")
+            return size, truncated
+
+    return n_stages, _truncated_copy(model, n_stages)
+
+
+def _select_ccp_alpha(model, X_fit, y_fit, X_val, y_val, min_r2):
+    """
+    Returns the strongest cost-complexity pruning whose validation R² stays above
+    min_r2, together with the pruned tree
+    """
+    path = model.cost_complexity_pruning_path(X_fit, y_fit)
+
+    # Walk from the strongest pruning down so the first acceptable tree is the smallest
+    for alpha in path.ccp_alphas[::-1]:
+        pruned = clone(model).set_params(ccp_alpha=alpha)
+        pruned.fit(X_fit, y_fit)
+        score = r2_score(y_val, pruned.predict(X_val))
+        if score >= min_r2:
+            logging.info(f"Selected ccp_alpha={alpha}: {model.tree_.node_count} -> {pruned.tree_.node_count} nodes (validation R²: {score})")
+            return float(alpha), pruned
+
+    return float(model.ccp_alpha), copy.deepcopy(model)
+
+
+def _convert_to_float32(model):
+    """
+    Casts float64 parameters to float32 in place where the estimator accepts it.
+    scikit-learn trees keep a fixed float64 node layout and XGBoost/CatBoost
+    already store float32 thresholds and leaf values, so only linear models change.
+    LinearRegression on the collinear one-hot columns can have large cancelling
+    coefficients; the caller keeps float64 when rounding breaks the R² budget.
+    Returns whether any parameters were converted.
+    """
+    if isinstance(model, LinearRegression):
+        model.coef_ = np.asarray(model.coef_, dtype=np.float32)
+        model.intercept_ = np.float32(model.intercept_)
+        return True
+    return False
+
+
+def _restore_float64(compressed, original):
+    """Undoes the float32 conversion by copying the original parameters back"""
+    if isinstance(compressed, LinearRegression):
+        compressed.coef_ = original.coef_
+        compressed.intercept_ = original.intercept_
+    return compressed
+
+
+def _strip_training_attributes(model):
+    """Removes training-only attributes from the fitted model in place"""
+    for attribute in TRAINING_ONLY_ATTRIBUTES:
+        if attribute in vars(model):
+            delattr(model, attribute)
@@ -19,18 +19,29 @@ from xgboost import XGBRegressor
 # Custom modules
 from src.exception import CustomException
 from src.logger import logging
-from src.utils import save_object, evaluate_models
+from src.utils import save_object, evaluate_models, race_models
+from src.components.model_compression import ModelCompressor
 
 # Configuration class using dataclass decorator
 @dataclass
 class ModelTrainerConfig:
     # Default path for saving trained models
     trained_model_file_path: str = os.path.join("artifacts", "model.pkl")
+    # Optional post-selection compression stage (see model_compression.py)
+    compress_model: bool = False
+    # Racing mode: fold-by-fold evaluation that stops families out of contention
+    racing: bool = False
+    racing_folds: int = 3
+    racing_confidence: float = 0.95
 
 class ModelTrainer:
     def __init__(self):
         # Initialize with configuration settings
         self.model_trainer_config = ModelTrainerConfig()
+        # Before/after cost report, filled when compress_model is enabled
+        self.compression_report = None
+        # Families abandoned by racing mode with their stopping details
+        self.early_stops = {}
 
     def initiate_model_trainer(self, train_array, test_array):
         """
@@ -110,15 +121,31 @@ class ModelTrainer:
             }
 
             # Model Evaluation
-            logging.info("Evaluating models with hyperparameter tuning")
-            model_report: dict = evaluate_models(
-                X_train=X_train,
-                y_train=y_train,
-                X_test=X_test,
-                y_test=y_test,
-                models=models,
-                param=params
-            )
+            if self.model_trainer_config.racing:
+                logging.info("Racing models fold by fold with early stopping")
+                model_report, self.early_stops = race_models(
+                    X_train=X_train,
+                    y_train=y_train,
+                    X_test=X_test,
+                    y_test=y_test,
+                    models=models,
+                    param=params,
+                    cv=self.model_trainer_config.racing_folds,
+                    confidence=self.model_trainer_config.racing_confidence
+                )
+            else:
+                logging.info("Evaluating models with hyperparameter tuning")
+                model_report: dict = evaluate_models(
+                    X_train=X_train,
+                    y_train=y_train,
+                    X_test=X_test,
+                    y_test=y_test,
+                    models=models,
+                    param=params
+                )
+
+            if self.early_stops:
+                logging.info(f"Early-stopped model families: {self.early_stops}")
 
             # Determine Best Model
             best_model_score = max(sorted(model_report.values()))
@@ -144,6 +171,13 @@ class ModelTrainer:
             r2_square = r2_score(y_test, predicted)
             logging.info(f"Best model R² score: {r2_square}")
 
+            # Optional Compression
+            if self.model_trainer_config.compress_model:
+                # Report is also persisted as JSON next to the compressed model
+                self.compression_report = ModelCompressor().initiate_model_compression(
+                    best_model, X_train, y_train, X_test, y_test
+                )
+
             return r2_square
 
         except Exception as e:
@@ -35,14 +35,36 @@ introducing several critical constraints:
 
 """
 
+import os
 from flask import Flask, request, render_template
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from src.pipeline.predict_pipeline import CustomData, PredictPipeline
+from src.pipeline.shadow_pipeline import ShadowConfig, ShadowEvaluator
+from src.exception import CustomException
+from src.logger import logging
+from src.pipeline.input_monitor import InputMonitor, training_vocabulary
 
 app = Flask(__name__)  # Simplified single app instance
 
+# Optional shadow evaluation: set SHADOW_MODEL_PATH to score a candidate model on live traffic
+shadow_evaluator = (
+    ShadowEvaluator(ShadowConfig(candidate_model_path=os.environ["SHADOW_MODEL_PATH"]))
+    if os.environ.get("SHADOW_MODEL_PATH") else None
+)
+
+# Running summaries of served inputs/predictions, snapshotted periodically per worker
+# Category counts are capped at the training vocabulary so arbitrary form values cannot grow memory.
+# Serving must not depend on train.csv: without it, fall back to the max_categories cap.
+try:
+    monitor_vocabulary = training_vocabulary()
+except CustomException as e:
+    logging.warning(f"Training data unavailable, input monitor uses the max_categories cap: {e}")
+    monitor_vocabulary = None
+input_monitor = InputMonitor(vocabulary=monitor_vocabulary)
+input_monitor.start_snapshots()
+
 @app.route('/')
 def index():
     """Landing page with security warnings still present"""
@@ -68,11 +90,29 @@ def predict_datapoint():
         pred_df = data.get_data_as_data_frame()
         
         # Removed debug print statements
-        predict_pipeline = PredictPipeline()
+        predict_pipeline = PredictPipeline(
+            shadow_evaluator=shadow_evaluator,
+            input_monitor=input_monitor,
+        )
         results = predict_pipeline.predict(pred_df)
 
         return render_template('home.html', results=results[0])
 
+@app.route('/shadowstats')
+def shadow_stats():
+    """Running comparison of the shadow candidate against the served model"""
+    if shadow_evaluator is None:
+        return {"enabled": False}
+    return {"enabled": True, **shadow_evaluator.stats()}
+
+@app.route('/inputstats')
+def input_stats():
+    """Drift of this worker's served inputs/predictions against the training data"""
+    try:
+        return input_monitor.compare_to_training()
+    except CustomException as e:
+        return {"error": str(e)}, 503
+
 if __name__ == "__main__":
     # Production recommendation in comments
     # Consider using production server like gunicorn/uvicorn
@@ -0,0 +1,421 @@
+"""
+Input monitoring components:
+- CategoryCounter: Counts of each category seen for a categorical field
+- RunningMoments: Count, mean and variance (Welford) for a numeric field
+- QuantileSketch: Mergeable, bounded-memory quantile sketch (KLL-style compactors)
+- InputMonitor: Keeps the above for every CustomData field and the predicted math score
+
+All summaries are cheap to update per request, serialize to JSON and merge,
+so snapshots written by separate workers can be combined offline and compared
+against the training distribution in artifacts/train.csv.
+"""
+
+import functools
+import glob
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+from src.exception import CustomException
+from src.logger import logging
+
+CATEGORICAL_FIELDS = [
+    "gender",
+    "race_ethnicity",
+    "parental_level_of_education",
+    "lunch",
+    "test_preparation_course",
+]
+NUMERICAL_FIELDS = ["reading_score", "writing_score"]
+PREDICTION_FIELD = "math_score"
+# Bucket for values outside the known vocabulary (or beyond max_categories)
+OTHER_CATEGORY = "__other__"
+
+
+class CategoryCounter:
+    """
+    Counts per category with a bounded number of keys. With a vocabulary (the
+    training categories) anything else is folded into OTHER_CATEGORY; without
+    one, the first max_categories distinct values are kept and the rest folded.
+    """
+
+    def __init__(self, vocabulary=None, max_categories: int = 64):
+        self.vocabulary = set(vocabulary) if vocabulary is not None else None
+        self.max_categories = max_categories
+        self.counts = {}
+
+    def _add(self, key, count):
+        if key != OTHER_CATEGORY and key not in self.counts:
+            if self.vocabulary is not None:
+                known = key in self.vocabulary
+            else:
+                known = len(self.counts) < self.max_categories
+            if not known:
+                key = OTHER_CATEGORY
+        self.counts[key] = self.counts.get(key, 0) + count
+
+    def update(self, value):
+        self._add(str(value), 1)
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self._add(key, count)
+
+    def frequencies(self):
+        total = sum(self.counts.values())
+        return {key: count / total for key, count in self.counts.items()} if total else {}
+
+    def to_dict(self):
+        return {
+            "vocabulary": sorted(self.vocabulary) if self.vocabulary is not None else None,
+            "max_categories": self.max_categories,
+            "counts": dict(self.counts),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        counter = cls(vocabulary=data.get("vocabulary"), max_categories=data.get("max_categories", 64))
+        counter.counts = dict(data["counts"])
+        return counter
+
+
+class RunningMoments:
+    """Streaming mean/variance using Welford updates and Chan's parallel merge"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, data):
+        moments = cls()
+        moments.count, moments.mean, moments.m2 = data["count"], data["mean"], data["m2"]
+        return moments
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch built from a stack of compactors.
+    Level h holds items of weight 2**h; a level that reaches k items is sorted and
+    every other item (random offset) is promoted, so memory stays O(k log(n / k)).
+    """
+
+    def __init__(self, k: int = 128):
+        self.k = k
+        self.count = 0
+        self.levels = [[]]
+
+    def update(self, value):
+        self.count += 1
+        self.levels[0].append(float(value))
+        if len(self.levels[0]) >= self.k:
+            self._compress()
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, level in enumerate(other.levels):
+            self.levels[h].extend(level)
+        self.count += other.count
+        self._compress()
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) >= self.k:
+                level.sort()
+                # Keep one item back on odd lengths so total weight is preserved
+                keep = level[-1:] if len(level) % 2 else []
+                paired = level[:len(level) - len(keep)]
+                promoted = paired[random.randint(0, 1)::2]
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                self.levels[h + 1].extend(promoted)
+                self.levels[h] = keep
+            h += 1
+
+    def quantile(self, q):
+        weighted = sorted((value, 2 ** h) for h, level in enumerate(self.levels) for value in level)
+        if not weighted:
+            return None
+        total = sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= q * total:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self):
+        return {"k": self.k, "count": self.count, "levels": [list(level) for level in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(k=data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [list(level) for level in data["levels"]]
+        return sketch
+
+
+@dataclass
+class InputMonitorConfig:
+    # Each worker writes its own snapshot file; merge_snapshots() combines them
+    snapshot_dir: str = os.path.join("artifacts", "monitoring")
+    snapshot_interval: float = 60.0
+    train_data_path: str = os.path.join("artifacts", "train.csv")
+    sketch_k: int = 128
+
+
+class InputMonitor:
+    """Bounded-memory summaries of serving inputs and predictions"""
+
+    def __init__(self, config: InputMonitorConfig = None, vocabulary=None):
+        """
+        Initialize one summary per field; snapshots start with start_snapshots()
+
+        Args:
+            config (InputMonitorConfig, optional): Snapshot and training data settings
+            vocabulary (dict, optional): Allowed categories per categorical field,
+                usually training_vocabulary(); other values count as OTHER_CATEGORY
+        """
+        self.config = config or InputMonitorConfig()
+        self._lock = threading.Lock()
+        vocabulary = vocabulary or {}
+        self.categories = {field: CategoryCounter(vocabulary.get(field)) for field in CATEGORICAL_FIELDS}
+        self.moments = {field: RunningMoments() for field in NUMERICAL_FIELDS + [PREDICTION_FIELD]}
+        self.quantiles = {
+            field: QuantileSketch(k=self.config.sketch_k)
+            for field in NUMERICAL_FIELDS + [PREDICTION_FIELD]
+        }
+
+    def update(self, features, preds=None):
+        """
+        Folds input rows (and their predictions) into the running summaries
+
+        Args:
+            features (DataFrame): Rows in CustomData.get_data_as_data_frame() format
+            preds (array, optional): Predicted math scores for the same rows
+        """
+        records = features.to_dict("records")
+        with self._lock:
+            for i, record in enumerate(records):
+                for field in CATEGORICAL_FIELDS:
+                    self.categories[field].update(record[field])
+                values = {field: record[field] for field in NUMERICAL_FIELDS}
+                if preds is not None:
+                    values[PREDICTION_FIELD] = preds[i]
+                for field, value in values.items():
+                    value = float(value)
+                    if math.isnan(value):
+                        continue
+                    self.moments[field].update(value)
+                    self.quantiles[field].update(value)
+
+    def merge(self, other):
+        """Merges another monitor (e.g. from another worker) into this one"""
+        with self._lock:
+            for field, counter in other.categories.items():
+                self.categories[field].merge(counter)
+            for field, moments in other.moments.items():
+                self.moments[field].merge(moments)
+            for field, sketch in other.quantiles.items():
+                self.quantiles[field].merge(sketch)
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "categories": {f: c.to_dict() for f, c in self.categories.items()},
+                "moments": {f: m.to_dict() for f, m in self.moments.items()},
+                "quantiles": {f: q.to_dict() for f, q in self.quantiles.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data, config: InputMonitorConfig = None):
+        monitor = cls(config)
+        monitor.categories = {f: CategoryCounter.from_dict(d) for f, d in data["categories"].items()}
+        monitor.moments = {f: RunningMoments.from_dict(d) for f, d in data["moments"].items()}
+        monitor.quantiles = {f: QuantileSketch.from_dict(d) for f, d in data["quantiles"].items()}
+        return monitor
+
+    def save_snapshot(self):
+        """
+        Writes the current summaries to this process's snapshot file
+
+        Returns:
+            str: Path of the snapshot file
+
+        Raises:
+            CustomException: If the snapshot cannot be written
+        """
+        try:
+            os.makedirs(self.config.snapshot_dir, exist_ok=True)
+            path = os.path.join(self.config.snapshot_dir, f"snapshot_{os.getpid()}.json")
+            # Write-then-rename so readers never see a partially written snapshot
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w") as file_obj:
+                json.dump({"timestamp": time.time(), **self.to_dict()}, file_obj)
+            os.replace(tmp_path, path)
+            return path
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def start_snapshots(self):
+        """Starts a daemon thread that saves a snapshot every snapshot_interval seconds"""
+        def run():
+            while True:
+                time.sleep(self.config.snapshot_interval)
+                try:
+                    self.save_snapshot()
+                except CustomException as e:
+                    logging.error(f"Input monitor snapshot failed: {e}")
+
+        threading.Thread(target=run, name="input-monitor-snapshots", daemon=True).start()
+
+    def compare_to_training(self):
+        """
+        Compares the serving summaries against the training distribution
+
+        Categorical fields report total variation distance between category
+        frequencies and the share of values outside the training vocabulary;
+        numeric fields report the mean shift in training standard deviations
+        and the differences of the 10th/50th/90th percentiles. The prediction
+        is compared against the training math_score. The training reference is
+        built once per process and cached.
+
+        Returns:
+            dict: Drift statistics per field
+
+        Raises:
+            CustomException: If the training data cannot be read
+        """
+        try:
+            reference = load_training_reference(self.config.train_data_path, self.config.sketch_k)
+            # Work on a copy taken under the lock so concurrent update() calls cannot
+            # resize the counters or rewrite sketch levels while the report is built
+            live_monitor = InputMonitor.from_dict(self.to_dict(), self.config)
+
+            report = {}
+            for field in CATEGORICAL_FIELDS:
+                live = live_monitor.categories[field].frequencies()
+                train = reference.categories[field].frequencies()
+                keys = set(live) | set(train)
+                report[field] = {
+                    "total_variation": 0.5 * sum(abs(live.get(k, 0.0) - train.get(k, 0.0)) for k in keys),
+                    "unseen_share": live.get(OTHER_CATEGORY, 0.0),
+                }
+
+            for field in NUMERICAL_FIELDS + [PREDICTION_FIELD]:
+                live, train = live_monitor.moments[field], reference.moments[field]
+                if live.count == 0:
+                    report[field] = {"count": 0}
+                    continue
+                train_std = math.sqrt(train.variance) or 1.0
+                report[field] = {
+                    "count": live.count,
+                    "mean_shift_std": (live.mean - train.mean) / train_std,
+                    "std_ratio": math.sqrt(live.variance) / train_std,
+                    **{
+                        f"p{int(q * 100)}_diff": live_monitor.quantiles[field].quantile(q) - reference.quantiles[field].quantile(q)
+                        for q in (0.1, 0.5, 0.9)
+                    },
+                }
+            return report
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+
+@functools.lru_cache(maxsize=None)
+def load_training_reference(train_data_path, sketch_k=128):
+    """
+    Builds (once per process) the summaries of the training distribution
+
+    Args:
+        train_data_path (str): Path of the training CSV
+        sketch_k (int): Quantile sketch size, matching the live monitor
+
+    Returns:
+        InputMonitor: Reference summaries; treat as read-only
+
+    Raises:
+        CustomException: If the training data cannot be read
+    """
+    try:
+        train_df = pd.read_csv(train_data_path)
+        reference = InputMonitor(InputMonitorConfig(train_data_path=train_data_path, sketch_k=sketch_k))
+        reference.update(train_df, preds=train_df[PREDICTION_FIELD].to_numpy())
+        return reference
+
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+def training_vocabulary(config: InputMonitorConfig = None):
+    """Returns the categories seen in training per categorical field"""
+    config = config or InputMonitorConfig()
+    reference = load_training_reference(config.train_data_path, config.sketch_k)
+    return {
+        field: set(counter.counts) - {OTHER_CATEGORY}
+        for field, counter in reference.categories.items()
+    }
+
+
+def merge_snapshots(config: InputMonitorConfig = None):
+    """
+    Combines the snapshot files of all workers into one InputMonitor
+
+    Args:
+        config (InputMonitorConfig, optional): Location of the snapshot files
+
+    Returns:
+        InputMonitor: Merged summaries
+
+    Raises:
+        CustomException: If a snapshot file cannot be read
+    """
+    try:
+        config = config or InputMonitorConfig()
+        merged = InputMonitor(config, vocabulary=training_vocabulary(config))
+        for path in glob.glob(os.path.join(config.snapshot_dir, "snapshot_*.json")):
+            with open(path) as file_obj:
+                merged.merge(InputMonitor.from_dict(json.load(file_obj), config))
+        return merged
+
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+if __name__ == "__main__":
+    # Merge all worker snapshots and print drift against the training data
+    print(json.dumps(merge_snapshots().compare_to_training(), indent=2))
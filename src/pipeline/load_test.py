@@ -0,0 +1,352 @@
+"""
+load_test.py: HTTP load-test harness for the prediction service
+
+Starts app.py locally, replays /predictdata form posts built from
+artifacts/test.csv and records throughput, error rate and latency
+percentiles per time window. Results are written as JSON keyed by git
+commit and serving mode so runs can be compared across deploys.
+
+Usage:
+    python -m src.pipeline.load_test --mode dev --concurrency 8 --rate 50 --duration 30
+    python -m src.pipeline.load_test --mode prefork --workers 4 --concurrency 32
+
+Prefork mode requires gunicorn (listed in requirements.txt).
+"""
+
+import argparse
+import http.client
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass, asdict
+
+import numpy as np
+import pandas as pd
+from src.exception import CustomException
+from src.logger import logging
+
+
+@dataclass
+class LoadTestConfig:
+    # Source of realistic form posts and destination of result files
+    test_data_path: str = os.path.join("artifacts", "test.csv")
+    results_dir: str = os.path.join("artifacts", "load_tests")
+    # Serving mode: "dev" (Flask development server) or "prefork" (gunicorn workers)
+    mode: str = "dev"
+    workers: int = 4
+    host: str = "127.0.0.1"
+    port: int = 5055
+    # Load shape: concurrent clients, target requests/second (0 = as fast as possible)
+    concurrency: int = 8
+    rate: float = 0.0
+    duration: float = 30.0
+    # Width of the time windows used for the over-time statistics (seconds)
+    window: float = 1.0
+    request_timeout: float = 10.0
+    startup_timeout: float = 30.0
+    # Trailing server stderr included in startup errors
+    stderr_tail_chars: int = 4000
+
+
+class LoadTester:
+    """Drives concurrent /predictdata traffic against a locally started app"""
+
+    def __init__(self, config: LoadTestConfig = None):
+        """Initialize with configuration (defaults to LoadTestConfig())"""
+        self.config = config or LoadTestConfig()
+        self.base_url = f"http://{self.config.host}:{self.config.port}"
+        # Server stderr goes to a temporary file so it cannot fill a pipe during long runs
+        self.server_log = None
+
+    def build_payloads(self):
+        """
+        Builds URL-encoded form bodies matching the fields read by predict_datapoint
+
+        Returns:
+            list: Encoded request bodies, one per row of the test set
+
+        Raises:
+            CustomException: If the test data cannot be read
+        """
+        try:
+            df = pd.read_csv(self.config.test_data_path)
+            payloads = []
+            for row in df.itertuples(index=False):
+                form = {
+                    "gender": row.gender,
+                    "ethnicity": row.race_ethnicity,
+                    "parental_level_of_education": row.parental_level_of_education,
+                    "lunch": row.lunch,
+                    "test_preparation_course": row.test_preparation_course,
+                    "reading_score": row.reading_score,
+                    "writing_score": row.writing_score,
+                }
+                payloads.append(urllib.parse.urlencode(form).encode())
+            return payloads
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def server_command(self):
+        """Returns the command line that starts the app in the configured serving mode"""
+        bind = f"{self.config.host}:{self.config.port}"
+        if self.config.mode == "dev":
+            return [sys.executable, "-m", "flask", "--app", "src.pipeline.app", "run",
+                    "--host", self.config.host, "--port", str(self.config.port)]
+        if self.config.mode == "prefork":
+            if importlib.util.find_spec("gunicorn") is None:
+                raise RuntimeError("Prefork mode requires gunicorn: pip install gunicorn")
+            return [sys.executable, "-m", "gunicorn", "--workers", str(self.config.workers),
+                    "--bind", bind, "src.pipeline.app:app"]
+        raise ValueError(f"Unknown serving mode: {self.config.mode}")
+
+    def start_server(self, probe_body):
+        """
+        Starts the app as a subprocess and waits until a real prediction succeeds
+
+        Args:
+            probe_body (bytes): Form body posted to /predictdata as readiness check
+
+        Returns:
+            subprocess.Popen: Running server process
+
+        Raises:
+            CustomException: If the server does not answer the probe with HTTP 200
+                within startup_timeout, or answers it with an error status; the
+                message includes the tail of the server's stderr
+        """
+        try:
+            command = self.server_command()
+            self.server_log = tempfile.TemporaryFile()
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=self.server_log)
+            try:
+                self._wait_until_ready(process, probe_body)
+            except Exception as e:
+                self.stop_server(process)
+                stderr = self.server_stderr
+                self.server_log.close()
+                self.server_log = None
+                raise RuntimeError(f"{e}\n--- server stderr ---\n{stderr}") from e
+            logging.info(f"Server ready in {self.config.mode} mode at {self.base_url}")
+            return process
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def stop_server(self, process):
+        """Terminates the server process and waits for it to exit"""
+        process.terminate()
+        process.wait()
+
+    @property
+    def server_stderr(self):
+        """Returns the last stderr_tail_chars characters written by the server"""
+        if self.server_log is None:
+            return ""
+        self.server_log.flush()
+        self.server_log.seek(0)
+        return self.server_log.read().decode(errors="replace")[-self.config.stderr_tail_chars:]
+
+    def _wait_until_ready(self, process, probe_body):
+        """Polls /predictdata until it returns 200; a non-200 answer fails immediately"""
+        request = urllib.request.Request(self.base_url + "/predictdata", data=probe_body, method="POST")
+        deadline = time.monotonic() + self.config.startup_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(request, timeout=self.config.request_timeout) as response:
+                    response.read()
+                    if response.status == 200:
+                        return
+                    raise RuntimeError(f"/predictdata probe answered HTTP {response.status}")
+            except urllib.error.HTTPError as e:
+                # Server is up but cannot serve predictions; load results would be meaningless
+                raise RuntimeError(f"/predictdata probe answered HTTP {e.code}")
+            except (urllib.error.URLError, http.client.HTTPException, OSError):
+                time.sleep(0.2)
+        raise RuntimeError("Server did not answer /predictdata within startup_timeout")
+
+    def _send(self, body):
+        """Posts one form body and returns (latency seconds, ok flag)"""
+        request = urllib.request.Request(self.base_url + "/predictdata", data=body, method="POST")
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.config.request_timeout) as response:
+                response.read()
+                ok = response.status == 200
+        except (urllib.error.URLError, http.client.HTTPException, OSError):
+            # HTTPException (IncompleteRead, BadStatusLine, ...) is not an OSError;
+            # record it as a failure instead of letting it end the client thread
+            ok = False
+        return time.perf_counter() - start, ok
+
+    def run_load(self, payloads):
+        """
+        Replays payloads from concurrent clients for the configured duration
+
+        With rate > 0 requests are issued on a fixed open-loop schedule shared by
+        all clients, so latency includes queueing when the server falls behind.
+
+        Args:
+            payloads (list): Encoded request bodies to cycle through
+
+        Returns:
+            list: (start offset, latency, ok) tuples for every request sent
+        """
+        records = []
+        lock = threading.Lock()
+        counter = iter(range(sys.maxsize))
+        interval = 1.0 / self.config.rate if self.config.rate > 0 else 0.0
+        t0 = time.perf_counter()
+
+        def client():
+            while True:
+                with lock:
+                    index = next(counter)
+                scheduled = index * interval
+                if scheduled >= self.config.duration:
+                    return
+                # Open-loop pacing: wait for this request's slot in the schedule
+                delay = scheduled - (time.perf_counter() - t0)
+                if delay > 0:
+                    time.sleep(delay)
+                offset = time.perf_counter() - t0
+                if offset >= self.config.duration:
+                    return
+                latency, ok = self._send(payloads[index % len(payloads)])
+                # Measure from the scheduled slot so server backlog is not hidden
+                if interval:
+                    latency += max(0.0, offset - scheduled)
+                with lock:
+                    records.append((offset, latency, ok))
+
+        threads = [threading.Thread(target=client, daemon=True) for _ in range(self.config.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return records
+
+    def summarize(self, records):
+        """
+        Aggregates request records into overall and per-window statistics
+
+        Args:
+            records (list): (start offset, latency, ok) tuples from run_load
+
+        Returns:
+            dict: Overall throughput, error rate, latency percentiles and a timeline
+        """
+        def stats(rows, elapsed):
+            latencies = np.array([r[1] for r in rows if r[2]])
+            errors = sum(1 for r in rows if not r[2])
+            summary = {
+                "requests": len(rows),
+                "throughput_rps": len(rows) / elapsed if elapsed > 0 else 0.0,
+                "success_rps": latencies.size / elapsed if elapsed > 0 else 0.0,
+                "error_rate": errors / len(rows) if rows else 0.0,
+            }
+            for p in (50, 90, 95, 99):
+                summary[f"p{p}_ms"] = float(np.percentile(latencies, p) * 1000) if latencies.size else None
+            return summary
+
+        window = self.config.window
+        timeline = []
+        n_windows = int(np.ceil(self.config.duration / window))
+        for i in range(n_windows):
+            rows = [r for r in records if i * window <= r[0] < (i + 1) * window]
+            timeline.append({"t": i * window, **stats(rows, window)})
+
+        return {"overall": stats(records, self.config.duration), "timeline": timeline}
+
+    def initiate_load_test(self):
+        """
+        Runs a complete load test: start server, replay traffic, save results
+
+        Returns:
+            str: Path of the JSON results file
+
+        Raises:
+            CustomException: If any step of the load test fails
+        """
+        try:
+            payloads = self.build_payloads()
+            process = self.start_server(payloads[0])
+            try:
+                logging.info(f"Load test started: {asdict(self.config)}")
+                records = self.run_load(payloads)
+            finally:
+                self.stop_server(process)
+                self.server_log.close()
+                self.server_log = None
+
+            commit = _git_commit()
+            results = {
+                "commit": commit,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "config": asdict(self.config),
+                **self.summarize(records),
+            }
+
+            # Worker count only varies the serving setup in prefork mode
+            workers = f"_w{self.config.workers}" if self.config.mode == "prefork" else ""
+            os.makedirs(self.config.results_dir, exist_ok=True)
+            results_path = os.path.join(
+                self.config.results_dir,
+                f"{commit[:12]}_{self.config.mode}{workers}_c{self.config.concurrency}"
+                f"_r{self.config.rate:g}_d{self.config.duration:g}.json",
+            )
+            with open(results_path, "w") as file_obj:
+                json.dump(results, file_obj, indent=2)
+            logging.info(f"Load test results saved to {results_path}: {results['overall']}")
+
+            return results_path
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+
+def _git_commit():
+    """Returns the current git commit hash, or 'unknown' outside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+if __name__ == "__main__":
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description="Load-test the /predictdata endpoint")
+    parser.add_argument("--mode", choices=["dev", "prefork"], default=defaults.mode)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser.add_argument("--rate", type=float, default=defaults.rate,
+                        help="Target requests/second (0 = closed loop, as fast as possible)")
+    parser.add_argument("--duration", type=float, default=defaults.duration)
+    parser.add_argument("--window", type=float, default=defaults.window)
+    args = parser.parse_args()
+
+    config = LoadTestConfig(
+        mode=args.mode,
+        workers=args.workers,
+        port=args.port,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        duration=args.duration,
+        window=args.window,
+    )
+    path = LoadTester(config).initiate_load_test()
+    with open(path) as f:
+        print(json.dumps(json.load(f)["overall"], indent=2))
@@ -6,6 +6,7 @@ Prediction pipeline components:
 
 import sys
 import os  # Required for path operations
+import time
 import pandas as pd
 from src.exception import CustomException
 from src.utils import load_object
@@ -14,9 +15,18 @@ from src.utils import load_object
 class PredictPipeline:
     """Handles model loading and makes predictions using trained artifacts"""
     
-    def __init__(self):
-        """Initialize prediction pipeline (no current initialization needed)"""
-        pass
+    def __init__(self, shadow_evaluator=None, input_monitor=None):
+        """
+        Initialize prediction pipeline
+
+        Args:
+            shadow_evaluator (ShadowEvaluator, optional): Receives every served input
+                for background scoring with a candidate model
+            input_monitor (InputMonitor, optional): Keeps running summaries of
+                served inputs and predictions
+        """
+        self.shadow_evaluator = shadow_evaluator
+        self.input_monitor = input_monitor
 
     def predict(self, features):
         """
@@ -45,12 +55,24 @@ class PredictPipeline:
             
             print("After Loading")
             
+            # Inference latency covers transform + predict only (same scope as the shadow candidate)
+            start = time.perf_counter()
+
             # Apply preprocessing to input data
             data_scaled = preprocessor.transform(features)
             
             # Generate predictions using preprocessed data
             preds = model.predict(data_scaled)
-            
+            inference_latency = time.perf_counter() - start
+
+            # Update bounded-memory input/prediction summaries
+            if self.input_monitor is not None:
+                self.input_monitor.update(features, preds)
+
+            # Hand off to shadow evaluation (non-blocking, drops when its queue is full)
+            if self.shadow_evaluator is not None:
+                self.shadow_evaluator.submit(features, preds, inference_latency)
+
             return preds
 
         except Exception as e:
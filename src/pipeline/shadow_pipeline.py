@@ -0,0 +1,182 @@
+"""
+Shadow evaluation components:
+- ShadowConfig: Candidate artifact paths and queue/batch settings
+- ShadowEvaluator: Scores live inputs with a candidate model in a background thread
+
+The request path only performs a non-blocking put into a bounded queue; when
+the queue is full the input is dropped and counted instead of adding latency.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from src.exception import CustomException
+from src.logger import logging
+from src.utils import load_object
+
+
+@dataclass
+class ShadowConfig:
+    # Candidate artifacts to evaluate against the serving model
+    candidate_model_path: str = os.path.join("artifacts", "candidate_model.pkl")
+    candidate_preprocessor_path: str = os.path.join("artifacts", "preprocessor.pkl")
+    # Bounded queue: inputs beyond this are dropped rather than delaying requests
+    max_queue_size: int = 1000
+    # Background worker scores up to batch_size inputs at once, or whatever arrived within flush_interval.
+    # batch_size=1 scores single rows, making candidate latency directly comparable to primary latency
+    batch_size: int = 64
+    flush_interval: float = 1.0
+    # Number of recent latencies kept for percentile reporting
+    latency_window: int = 10000
+
+
+class ShadowEvaluator:
+    """Queues served inputs and scores them with a candidate model off the request path"""
+
+    def __init__(self, config: ShadowConfig = None):
+        """Initialize queue, running statistics and start the background worker"""
+        self.config = config or ShadowConfig()
+        self._queue = queue.Queue(maxsize=self.config.max_queue_size)
+        self._lock = threading.Lock()
+
+        # Running statistics of candidate - primary deltas
+        self._scored = 0
+        self._dropped = 0
+        self._failed_batches = 0
+        self._delta_sum = 0.0
+        self._abs_delta_sum = 0.0
+        self._sq_delta_sum = 0.0
+        self._max_abs_delta = 0.0
+        # Primary: transform + predict per request; candidate: (batch latency, batch rows) per batch
+        self._primary_latencies = deque(maxlen=self.config.latency_window)
+        self._candidate_batches = deque(maxlen=self.config.latency_window)
+
+        # None while loading, then True/False; a failed load is reported by stats()
+        self._candidate_loaded = None
+        self._candidate_error = None
+
+        self._worker = threading.Thread(target=self._run, name="shadow-evaluator", daemon=True)
+        self._worker.start()
+
+    def submit(self, features, primary_preds, primary_latency):
+        """
+        Enqueues one served request for shadow scoring without blocking
+
+        Args:
+            features (DataFrame): Raw input rows given to the primary pipeline
+            primary_preds (array): Predictions returned to the client
+            primary_latency (float): Primary transform + predict latency in seconds
+
+        Returns:
+            bool: True if queued, False if dropped because the queue is full
+        """
+        try:
+            self._queue.put_nowait((features, np.asarray(primary_preds, dtype=float), primary_latency))
+            return True
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+
+    def stats(self):
+        """
+        Returns a snapshot of the shadow comparison
+
+        Returns:
+            dict: Candidate load status, counts, prediction delta summary and
+                  latency percentiles (ms). Primary percentiles are per request;
+                  candidate percentiles are per batch, with the mean batch size
+                  and amortized per-row latency alongside.
+        """
+        with self._lock:
+            n = self._scored
+            mean_delta = self._delta_sum / n if n else None
+            summary = {
+                "candidate_loaded": self._candidate_loaded,
+                "candidate_error": self._candidate_error,
+                "scored": n,
+                "dropped": self._dropped,
+                "failed_batches": self._failed_batches,
+                "queued": self._queue.qsize(),
+                "mean_delta": mean_delta,
+                "mean_abs_delta": self._abs_delta_sum / n if n else None,
+                "rmse_delta": float(np.sqrt(self._sq_delta_sum / n)) if n else None,
+                "max_abs_delta": self._max_abs_delta if n else None,
+            }
+            primary = np.array(self._primary_latencies) * 1000
+            batches = np.array(self._candidate_batches, dtype=float).reshape(-1, 2)
+            candidate = batches[:, 0] * 1000
+            for p in (50, 99):
+                summary[f"primary_p{p}_ms"] = float(np.percentile(primary, p)) if primary.size else None
+                summary[f"candidate_batch_p{p}_ms"] = float(np.percentile(candidate, p)) if candidate.size else None
+            summary["candidate_mean_batch_size"] = float(batches[:, 1].mean()) if batches.size else None
+            summary["candidate_per_row_ms"] = (
+                float(candidate.sum() / batches[:, 1].sum()) if batches.size else None
+            )
+        return summary
+
+    def _next_batch(self):
+        """Blocks for the first item, then collects more until batch_size or flush_interval"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.config.flush_interval
+        while len(batch) < self.config.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """Background worker: load candidate artifacts once, then score batches forever"""
+        try:
+            model = load_object(file_path=self.config.candidate_model_path)
+            preprocessor = load_object(file_path=self.config.candidate_preprocessor_path)
+            logging.info(f"Shadow candidate loaded from {self.config.candidate_model_path}")
+        except CustomException as e:
+            logging.error(f"Shadow evaluation disabled: {e}")
+            with self._lock:
+                self._candidate_loaded = False
+                self._candidate_error = str(e)
+            return
+
+        with self._lock:
+            self._candidate_loaded = True
+
+        while True:
+            batch = self._next_batch()
+            try:
+                features = pd.concat([item[0] for item in batch], ignore_index=True)
+                primary = np.concatenate([item[1] for item in batch])
+
+                start = time.perf_counter()
+                candidate = np.asarray(model.predict(preprocessor.transform(features)), dtype=float)
+                batch_latency = time.perf_counter() - start
+
+                self._record(batch, primary, candidate, batch_latency)
+            except Exception as e:
+                # Shadow failures must never affect serving; count and keep going
+                logging.error(f"Shadow batch failed: {CustomException(e, sys)}")
+                with self._lock:
+                    self._failed_batches += 1
+
+    def _record(self, batch, primary, candidate, batch_latency):
+        """Folds one scored batch into the running statistics"""
+        delta = candidate - primary
+        with self._lock:
+            self._scored += delta.size
+            self._delta_sum += float(delta.sum())
+            self._abs_delta_sum += float(np.abs(delta).sum())
+            self._sq_delta_sum += float(np.square(delta).sum())
+            self._max_abs_delta = max(self._max_abs_delta, float(np.abs(delta).max()))
+            self._primary_latencies.extend(item[2] for item in batch)
+            self._candidate_batches.append((batch_latency, delta.size))
@@ -0,0 +1,140 @@
+"""
+Training pipeline:
+- TrainPipeline: Runs ingestion, transformation and model training end to end,
+  optionally in compact dtype mode (categoricals, Int8 scores, float32 features)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from sklearn.base import clone
+from sklearn.metrics import r2_score
+from src.components.data_ingestion import DataIngestion
+from src.components.data_transformation import DataTransformation
+from src.components.model_trainer import ModelTrainer
+from src.exception import CustomException
+from src.logger import logging
+from src.utils import load_object
+
+
+class TrainPipeline:
+    """Orchestrates the training components and reports compact dtype savings"""
+
+    def __init__(self, compact_dtypes: bool = False):
+        """
+        Args:
+            compact_dtypes (bool): Use categoricals/Int8 during ingestion and
+                float32 feature matrices during transformation and training
+        """
+        self.compact_dtypes = compact_dtypes
+        self.memory_report_path = os.path.join("artifacts", "memory_report.json")
+
+    def run_pipeline(self):
+        """
+        Runs ingestion, transformation and training
+
+        Returns:
+            float: R² score of the best performing model
+
+        Raises:
+            CustomException: If any stage fails
+        """
+        try:
+            ingestion = DataIngestion()
+            ingestion.ingestion_config.compact_dtypes = self.compact_dtypes
+            train_data, test_data = ingestion.initiate_data_ingestion()
+
+            transformation = DataTransformation()
+            transformation.data_transformation_config.compact_dtypes = self.compact_dtypes
+            train_arr, test_arr, _ = transformation.initiate_data_transformation(train_data, test_data)
+
+            if self.compact_dtypes:
+                self._save_memory_report({**ingestion.memory_report, **transformation.memory_report})
+
+            return ModelTrainer().initiate_model_trainer(train_arr, test_arr)
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def check_compact_dtypes(self, r2_tolerance: float = 1e-3):
+        """
+        Verifies that compact dtypes leave the winning model's R² unchanged
+
+        Selects the winner once on the default (float64) arrays, then refits it
+        with a fixed random_state on both the float64 and float32 arrays so the
+        R² difference reflects the dtype change only, not training randomness.
+        All intermediate artifacts go to a temporary directory, so the served
+        model.pkl / preprocessor.pkl are left untouched.
+
+        Args:
+            r2_tolerance (float): Largest accepted absolute R² difference
+
+        Returns:
+            dict: Winner, float64 and float32 R², their difference and whether
+                  it is within tolerance
+
+        Raises:
+            CustomException: If the check cannot be run
+        """
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                ingestion = DataIngestion()
+                config = ingestion.ingestion_config
+                config.compact_dtypes = True
+                config.train_data_path = os.path.join(tmp_dir, "train.csv")
+                config.test_data_path = os.path.join(tmp_dir, "test.csv")
+                config.raw_data_path = os.path.join(tmp_dir, "data.csv")
+                train_data, test_data = ingestion.initiate_data_ingestion()
+
+                arrays = {}
+                for mode, compact in (("float64", False), ("float32", True)):
+                    transformation = DataTransformation()
+                    transformation.data_transformation_config.compact_dtypes = compact
+                    transformation.data_transformation_config.preprocessor_obj_file_path = os.path.join(
+                        tmp_dir, f"preprocessor_{mode}.pkl"
+                    )
+                    arrays[mode] = transformation.initiate_data_transformation(train_data, test_data)[:2]
+
+                # Model selection once, on the default float64 arrays
+                trainer = ModelTrainer()
+                trainer.model_trainer_config.trained_model_file_path = os.path.join(tmp_dir, "model.pkl")
+                trainer.initiate_model_trainer(*arrays["float64"])
+                winner = load_object(file_path=trainer.model_trainer_config.trained_model_file_path)
+
+            scores = {}
+            for mode, (train_arr, test_arr) in arrays.items():
+                model = clone(winner)
+                if "random_state" in model.get_params():
+                    model.set_params(random_state=0)
+                model.fit(train_arr[:, :-1], train_arr[:, -1])
+                scores[f"{mode}_r2"] = r2_score(test_arr[:, -1], model.predict(test_arr[:, :-1]))
+
+            difference = abs(scores["float64_r2"] - scores["float32_r2"])
+            report = {
+                "model": type(winner).__name__,
+                **scores,
+                "r2_difference": difference,
+                "within_tolerance": bool(difference <= r2_tolerance),
+            }
+            self._save_memory_report(
+                {**ingestion.memory_report, **transformation.memory_report, "r2_check": report}
+            )
+            logging.info(f"Compact dtype R² check: {report}")
+
+            return report
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def _save_memory_report(self, report):
+        """Writes the per-stage memory report next to the other artifacts"""
+        os.makedirs(os.path.dirname(self.memory_report_path), exist_ok=True)
+        with open(self.memory_report_path, "w") as file_obj:
+            json.dump(report, file_obj, indent=2, default=float)
+        logging.info(f"Memory report saved to {self.memory_report_path}")
+
+
+if __name__ == "__main__":
+    print(TrainPipeline(compact_dtypes=True).check_compact_dtypes())
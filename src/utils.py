@@ -11,9 +11,26 @@ import numpy as np
 import pandas as pd
 import dill
 import pickle
+from scipy import stats
+from sklearn.base import clone
 from sklearn.metrics import r2_score
-from sklearn.model_selection import GridSearchCV
+from sklearn.model_selection import GridSearchCV, KFold, ParameterGrid
 from src.exception import CustomException
+from src.logger import logging
+
+# Compact dtypes for the raw student data: categoricals for the five string
+# columns and nullable Int8 for the 0-100 scores (instead of object strings and
+# int64); nullable so missing scores still reach the transformer's imputers
+COMPACT_DTYPES = {
+    "gender": "category",
+    "race_ethnicity": "category",
+    "parental_level_of_education": "category",
+    "lunch": "category",
+    "test_preparation_course": "category",
+    "math_score": "Int8",
+    "reading_score": "Int8",
+    "writing_score": "Int8",
+}
 
 
 def save_object(file_path, obj):
@@ -93,6 +110,163 @@ def evaluate_models(X_train, y_train, X_test, y_test, models, param):
         raise CustomException(e, sys)
     
 
+def race_models(X_train, y_train, X_test, y_test, models, param, cv=3, confidence=0.95):
+    """
+    Evaluates model families fold by fold and stops configurations, and whole
+    families, that are statistically out of contention.
+
+    Every live configuration of every family is scored on the same KFold splits
+    (same fold budget as evaluate_models). After each fold, each configuration is
+    compared with the leading configuration (highest mean CV R² so far) on the
+    per-row squared errors of all validation rows seen so far. A configuration
+    is dropped once the one-sided lower confidence bound of its mean squared-error
+    excess over the leader is above zero; a family is stopped once all of its
+    configurations are dropped. Because the test uses every validation row, it
+    can fire after the first fold.
+
+    The error rate 1 - confidence is Bonferroni-split over all looks (folds) and
+    challenger configurations. Rows are treated as independent and the leader is
+    itself chosen from the data, so the bound is a heuristic rather than an
+    exact guarantee.
+
+    Configurations that fail to fit or predict are dropped and logged, like the
+    NaN scores GridSearchCV records for them in evaluate_models.
+
+    Args:
+        X_train (numpy.ndarray): Training features
+        y_train (numpy.ndarray): Training target
+        X_test (numpy.ndarray): Testing features
+        y_test (numpy.ndarray): Testing target
+        models (dict): Dictionary of model instances to evaluate
+        param (dict): Dictionary of hyperparameter grids for each model
+        cv (int): Number of cross-validation folds
+        confidence (float): Confidence level of the elimination bound
+
+    Returns:
+        tuple: (report, early_stops) where report maps completed families to
+               test R² (same contract as evaluate_models) and early_stops maps
+               stopped families to the stopping fold, CV mean, leader and bound
+
+    Raises:
+        CustomException: If any error occurs during model evaluation
+    """
+    try:
+        folds = list(KFold(n_splits=cv).split(X_train))
+        configs = [(name, params) for name in models for params in ParameterGrid(param[name])]
+        fold_r2 = [[] for _ in configs]
+        sq_errors = [[] for _ in configs]
+        alive = set(range(len(configs)))
+        failed = {}   # config -> error message
+        dropped = {}  # config -> lower bound of its squared-error excess over the leader
+
+        # Bonferroni over looks x challenger configurations
+        alpha = (1 - confidence) / max(1, cv * (len(configs) - 1))
+        z_value = stats.norm.ppf(1 - alpha)
+
+        report = {}
+        early_stops = {}
+
+        for fold, (train_idx, val_idx) in enumerate(folds, start=1):
+            # Score every live configuration on this fold; failures are dropped
+            y_val = y_train[val_idx]
+            for c in sorted(alive):
+                name, params = configs[c]
+                try:
+                    estimator = clone(models[name]).set_params(**params)
+                    estimator.fit(X_train[train_idx], y_train[train_idx])
+                    pred = estimator.predict(X_train[val_idx])
+                except Exception as e:
+                    logging.warning(f"Racing: {name} {params} failed, dropping it: {e}")
+                    alive.discard(c)
+                    failed[c] = str(e)
+                    continue
+                fold_r2[c].append(r2_score(y_val, pred))
+                sq_errors[c].append((y_val - pred) ** 2)
+
+            if not alive:
+                break
+
+            # Leader: live configuration with the highest mean CV R² so far
+            leader = max(alive, key=lambda c: np.mean(fold_r2[c]))
+            leader_errors = np.concatenate(sq_errors[leader])
+
+            for c in sorted(alive - {leader}):
+                excess = np.concatenate(sq_errors[c]) - leader_errors
+                lower_bound = excess.mean() - z_value * excess.std(ddof=1) / np.sqrt(excess.size)
+                if lower_bound > 0:
+                    alive.discard(c)
+                    dropped[c] = lower_bound
+
+            # A family with no live configuration left is out of the race
+            for name in models:
+                family = [c for c, (family_name, _) in enumerate(configs) if family_name == name]
+                if name in early_stops or any(c in alive for c in family):
+                    continue
+                scored = [c for c in family if c in dropped]
+                best = max(scored, key=lambda c: np.mean(fold_r2[c])) if scored else None
+                early_stops[name] = {
+                    "early_stopped_at_fold": fold,
+                    "reason": "out of contention" if best is not None else "all configurations failed",
+                    "cv_mean_r2": float(np.mean(fold_r2[best])) if best is not None else None,
+                    "leader": configs[leader][0],
+                    "leader_cv_mean_r2": float(np.mean(fold_r2[leader])),
+                    "mse_gap_lower_bound": float(dropped[best]) if best is not None else None,
+                    "failed_configurations": sum(1 for c in family if c in failed),
+                }
+
+        # Refit surviving families with their best live configuration and score on the test set
+        for name in models:
+            family = [c for c in alive if configs[c][0] == name]
+            if not family:
+                continue
+            best = max(family, key=lambda c: np.mean(fold_r2[c]))
+            model = models[name]
+            model.set_params(**configs[best][1])
+            model.fit(X_train, y_train)
+            report[name] = r2_score(y_test, model.predict(X_test))
+
+        return report, early_stops
+
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+def dataframe_memory_report(df):
+    """
+    Compares the memory of a DataFrame in compact dtypes against pandas defaults.
+
+    Args:
+        df (pd.DataFrame): Data in compact dtypes (see COMPACT_DTYPES)
+
+    Returns:
+        dict: Default (object/int64) bytes, compact bytes and saving ratio
+
+    Raises:
+        CustomException: If the memory comparison fails
+    """
+    try:
+        # Rebuild the default-dtype frame pandas would have produced from the CSV
+        # (scores with missing values would have been read as float64)
+        default_dtypes = {
+            column: (
+                object if dtype == "category"
+                else np.float64 if df[column].isna().any() else np.int64
+            )
+            for column, dtype in COMPACT_DTYPES.items() if column in df.columns
+        }
+        default_bytes = int(df.astype(default_dtypes).memory_usage(deep=True).sum())
+        compact_bytes = int(df.memory_usage(deep=True).sum())
+
+        return {
+            "default_bytes": default_bytes,
+            "compact_bytes": compact_bytes,
+            "saving_ratio": default_bytes / compact_bytes if compact_bytes else None,
+        }
+
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
 def load_object(file_path):
     """
     Loads a serialized Python object from a file using pickle.
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# src/exception.py imports the logger as a top-level module ("from logger import logging"),
+# so both the repository root and src/ need to be importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
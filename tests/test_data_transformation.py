@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.components.data_transformation import DataTransformation
+from src.pipeline.predict_pipeline import CustomData
+from src.utils import COMPACT_DTYPES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRAIN_PATH = os.path.join(ROOT, "artifacts", "train.csv")
+
+
+def _fitted_preprocessor(compact):
+    transformation = DataTransformation()
+    transformation.data_transformation_config.compact_dtypes = compact
+    train_df = pd.read_csv(TRAIN_PATH, dtype=COMPACT_DTYPES if compact else None)
+    preprocessor = transformation.get_data_transformer_object()
+    preprocessor.fit(train_df.drop(columns=["math_score"]))
+    return preprocessor
+
+
+def _custom_rows():
+    data = CustomData(
+        gender="female",
+        race_ethnicity="group B",
+        parental_level_of_education="bachelor's degree",
+        lunch="standard",
+        test_preparation_course="none",
+        reading_score=72.0,
+        writing_score=74.0,
+    )
+    return data.get_data_as_data_frame()
+
+
+def test_compact_preprocessor_outputs_float32_for_custom_data():
+    rows = _custom_rows()
+    # Serving rows arrive as plain strings and Python floats, not categoricals/Int8
+    assert not isinstance(rows["gender"].dtype, pd.CategoricalDtype)
+    assert rows["reading_score"].dtype == np.float64
+
+    transformed = _fitted_preprocessor(compact=True).transform(rows)
+
+    assert transformed.dtype == np.float32
+
+
+def test_compact_and_default_preprocessors_agree():
+    rows = _custom_rows()
+
+    compact = _fitted_preprocessor(compact=True).transform(rows)
+    default = _fitted_preprocessor(compact=False).transform(rows)
+
+    assert default.dtype == np.float64
+    np.testing.assert_allclose(compact, default, rtol=1e-5, atol=1e-5)
@@ -0,0 +1,136 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.input_monitor import (
+    OTHER_CATEGORY,
+    CategoryCounter,
+    InputMonitor,
+    QuantileSketch,
+    RunningMoments,
+)
+
+
+def _stream(n=5000, seed=0):
+    return np.random.RandomState(seed).normal(60, 15, n)
+
+
+def test_running_moments_merge_matches_full_stream():
+    values = _stream()
+    full, left, right = RunningMoments(), RunningMoments(), RunningMoments()
+    for v in values:
+        full.update(v)
+    for v in values[:1234]:
+        left.update(v)
+    for v in values[1234:]:
+        right.update(v)
+
+    left.merge(right)
+
+    assert left.count == full.count == len(values)
+    assert np.isclose(left.mean, np.mean(values))
+    assert np.isclose(left.variance, np.var(values, ddof=1))
+    assert np.isclose(left.variance, full.variance)
+
+
+def test_quantile_sketch_merge_matches_full_stream():
+    random.seed(0)
+    values = _stream()
+    parts = np.array_split(values, 4)
+    merged = QuantileSketch(k=128)
+    for part in parts:
+        sketch = QuantileSketch(k=128)
+        for v in part:
+            sketch.update(v)
+        merged.merge(sketch)
+
+    assert merged.count == len(values)
+    # Bounded memory: far fewer retained items than the stream length
+    assert sum(len(level) for level in merged.levels) < len(values) / 4
+    for q in (0.1, 0.5, 0.9):
+        # Rank error of the estimate stays within a few percent
+        rank = np.mean(values <= merged.quantile(q))
+        assert abs(rank - q) < 0.03
+
+
+def test_category_counter_is_capped_at_vocabulary():
+    counter = CategoryCounter(vocabulary={"female", "male"})
+    for value in ["female", "male", "x1", "x2", "x3"]:
+        counter.update(value)
+
+    assert counter.counts == {"female": 1, "male": 1, OTHER_CATEGORY: 3}
+
+
+def test_category_counter_without_vocabulary_is_bounded():
+    counter = CategoryCounter(max_categories=3)
+    for i in range(100):
+        counter.update(f"value-{i}")
+
+    assert len(counter.counts) == 4
+    assert counter.counts[OTHER_CATEGORY] == 97
+
+
+def test_input_monitor_round_trip_and_merge():
+    features = pd.DataFrame({
+        "gender": ["female", "male", "male"],
+        "race_ethnicity": ["group A", "group B", "group C"],
+        "parental_level_of_education": ["some college"] * 3,
+        "lunch": ["standard"] * 3,
+        "test_preparation_course": ["none"] * 3,
+        "reading_score": [70.0, 80.0, 90.0],
+        "writing_score": [65.0, 75.0, 85.0],
+    })
+    monitor = InputMonitor(vocabulary={"gender": {"female", "male"}})
+    monitor.update(features, preds=np.array([60.0, 70.0, 80.0]))
+
+    restored = InputMonitor.from_dict(monitor.to_dict())
+    restored.merge(monitor)
+
+    assert restored.categories["gender"].counts == {"female": 2, "male": 4}
+    assert restored.moments["math_score"].count == 6
+    assert np.isclose(restored.moments["reading_score"].mean, 80.0)
+
+
+def test_compare_to_training_is_safe_during_concurrent_updates(tmp_path):
+    import threading
+
+    from src.pipeline.input_monitor import InputMonitorConfig
+
+    rng = np.random.RandomState(0)
+    rows = pd.DataFrame({
+        "gender": rng.choice(["female", "male"], 400),
+        "race_ethnicity": rng.choice(["group A", "group B"], 400),
+        "parental_level_of_education": ["some college"] * 400,
+        "lunch": ["standard"] * 400,
+        "test_preparation_course": ["none"] * 400,
+        "math_score": rng.randint(0, 100, 400),
+        "reading_score": rng.randint(0, 100, 400),
+        "writing_score": rng.randint(0, 100, 400),
+    })
+    train_path = tmp_path / "train.csv"
+    rows.to_csv(train_path, index=False)
+
+    # No vocabulary, so every new category value adds a counter key during the reads
+    monitor = InputMonitor(InputMonitorConfig(train_data_path=str(train_path), sketch_k=16))
+    features = rows.drop(columns=["math_score"])
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            batch = features.iloc[[i % 400]].copy()
+            batch["gender"] = f"value-{i}"
+            monitor.update(batch, preds=np.array([50.0]))
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(200):
+            report = monitor.compare_to_training()
+    finally:
+        stop.set()
+        thread.join()
+
+    assert "gender" in report and "math_score" in report
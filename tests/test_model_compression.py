@@ -0,0 +1,110 @@
+import json
+
+import numpy as np
+import pytest
+from catboost import CatBoostRegressor
+from sklearn.ensemble import AdaBoostRegressor, GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+from xgboost import XGBRegressor
+
+from src.components.model_compression import (
+    ModelCompressor,
+    _ensemble_size,
+    _strip_training_attributes,
+    _truncated_copy,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.RandomState(0)
+    X = rng.rand(200, 4)
+    y = X @ np.array([3.0, 2.0, 1.0, 0.5]) + 0.1 * rng.randn(200)
+    return X, y
+
+
+def _prefix_prediction(model, X, n):
+    """Reference prediction of the first n stages using each library's own API"""
+    if isinstance(model, RandomForestRegressor):
+        return np.mean([tree.predict(X) for tree in model.estimators_[:n]], axis=0)
+    if isinstance(model, (GradientBoostingRegressor, AdaBoostRegressor)):
+        return list(model.staged_predict(X))[n - 1]
+    if isinstance(model, CatBoostRegressor):
+        return model.predict(X, ntree_end=n)
+    return model.predict(X, iteration_range=(0, n))
+
+
+@pytest.mark.parametrize("model", [
+    RandomForestRegressor(n_estimators=16, random_state=0),
+    GradientBoostingRegressor(n_estimators=16, random_state=0),
+    AdaBoostRegressor(n_estimators=16, random_state=0),
+    CatBoostRegressor(iterations=16, verbose=False, random_seed=0, allow_writing_files=False),
+    XGBRegressor(n_estimators=16),
+], ids=lambda m: type(m).__name__)
+def test_truncated_copy_matches_prefix_prediction(model, data):
+    X, y = data
+    model.fit(X, y)
+    full_prediction = model.predict(X)
+
+    truncated = _truncated_copy(model, 4)
+
+    assert _ensemble_size(truncated) == 4
+    np.testing.assert_allclose(truncated.predict(X), _prefix_prediction(model, X, 4), rtol=1e-5)
+    # The original model is left untouched
+    assert _ensemble_size(model) == 16
+    np.testing.assert_allclose(model.predict(X), full_prediction)
+
+
+def test_strip_training_attributes_keeps_predictions(data):
+    X, y = data
+    model = LinearRegression().fit(X, y)
+    expected = model.predict(X)
+
+    _strip_training_attributes(model)
+
+    assert not hasattr(model, "singular_") and not hasattr(model, "rank_")
+    np.testing.assert_allclose(model.predict(X), expected)
+
+
+def _compressor(tmp_path):
+    compressor = ModelCompressor()
+    config = compressor.model_compression_config
+    config.compressed_model_file_path = str(tmp_path / "model_compressed.pkl")
+    config.compression_report_file_path = str(tmp_path / "compression_report.json")
+    config.timing_repeats = 2
+    return compressor
+
+
+def test_compression_report_is_persisted(data, tmp_path):
+    X, y = data
+    model = RandomForestRegressor(n_estimators=32, random_state=0).fit(X[:150], y[:150])
+    compressor = _compressor(tmp_path)
+    config = compressor.model_compression_config
+
+    report = compressor.initiate_model_compression(model, X[:150], y[:150], X[150:], y[150:])
+
+    # The R² budget is enforced on the validation split carved from the training data
+    assert report["validation_r2_after"] >= report["validation_r2_before"] - config.max_r2_loss
+    assert report["n_estimators_after"] == report["level"]["n_stages"] <= report["n_estimators_before"]
+    assert {"baseline_r2", "compressed_r2"} <= set(report)
+    with open(config.compression_report_file_path) as file_obj:
+        saved = json.load(file_obj)
+    assert saved["after"]["artifact_size_bytes"] == report["after"]["artifact_size_bytes"]
+
+
+@pytest.mark.parametrize("model", [
+    RandomForestRegressor(n_estimators=32, random_state=0),
+    DecisionTreeRegressor(random_state=0),
+    CatBoostRegressor(iterations=32, verbose=False, random_seed=0, allow_writing_files=False),
+], ids=lambda m: type(m).__name__)
+def test_compression_level_does_not_depend_on_test_set(model, data, tmp_path):
+    X, y = data
+    model.fit(X[:150], y[:150])
+    noise = np.random.RandomState(1).randn(50)
+
+    report = _compressor(tmp_path).initiate_model_compression(model, X[:150], y[:150], X[150:], y[150:])
+    shuffled = _compressor(tmp_path).initiate_model_compression(model, X[:150], y[:150], X[150:], noise)
+
+    assert report["level"] == shuffled["level"]
+    assert report["compressed_r2"] != shuffled["compressed_r2"]
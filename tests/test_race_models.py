@@ -0,0 +1,75 @@
+import numpy as np
+from sklearn.dummy import DummyRegressor
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.tree import DecisionTreeRegressor
+
+from src.utils import race_models
+
+
+def _data():
+    rng = np.random.RandomState(0)
+    X = rng.rand(300, 4)
+    y = X @ np.array([3.0, 2.0, 1.0, 0.5]) + 0.1 * rng.randn(300)
+    return X[:240], y[:240], X[240:], y[240:]
+
+
+def test_hopeless_family_is_stopped_early():
+    X_train, y_train, X_test, y_test = _data()
+    models = {"Linear Regression": LinearRegression(), "Dummy": DummyRegressor()}
+    params = {"Linear Regression": {}, "Dummy": {"strategy": ["mean", "median"]}}
+
+    report, early_stops = race_models(X_train, y_train, X_test, y_test, models, params, cv=3)
+
+    # Report keeps the evaluate_models contract: test R² floats only
+    assert set(report) == {"Linear Regression"}
+    assert report["Linear Regression"] > 0.9
+    stop = early_stops["Dummy"]
+    assert stop["leader"] == "Linear Regression"
+    assert stop["reason"] == "out of contention"
+    # Stops before the last fold, so CV fits are actually saved
+    assert stop["early_stopped_at_fold"] < 3
+    assert stop["mse_gap_lower_bound"] > 0
+
+
+def test_close_families_both_complete():
+    X_train, y_train, X_test, y_test = _data()
+    models = {"Linear Regression": LinearRegression(), "Ridge": Ridge(alpha=0.01)}
+    params = {"Linear Regression": {}, "Ridge": {}}
+
+    report, early_stops = race_models(X_train, y_train, X_test, y_test, models, params, cv=3)
+
+    assert early_stops == {}
+    assert set(report) == {"Linear Regression", "Ridge"}
+    # Genuinely different models with close scores
+    assert report["Linear Regression"] != report["Ridge"]
+    assert abs(report["Linear Regression"] - report["Ridge"]) < 0.01
+
+
+def test_invalid_configuration_is_dropped_not_fatal():
+    X_train, y_train, X_test, y_test = _data()
+    models = {"Linear Regression": LinearRegression(), "Decision Tree": DecisionTreeRegressor(random_state=0)}
+    params = {
+        "Linear Regression": {},
+        "Decision Tree": {"criterion": ["squared_error", "not_a_criterion"]},
+    }
+
+    report, early_stops = race_models(X_train, y_train, X_test, y_test, models, params, cv=3)
+
+    assert "Linear Regression" in report
+    if "Decision Tree" in early_stops:
+        assert early_stops["Decision Tree"]["failed_configurations"] == 1
+        assert early_stops["Decision Tree"]["reason"] == "out of contention"
+    else:
+        assert models["Decision Tree"].criterion == "squared_error"
+
+
+def test_family_with_only_invalid_configurations_is_reported():
+    X_train, y_train, X_test, y_test = _data()
+    models = {"Linear Regression": LinearRegression(), "Decision Tree": DecisionTreeRegressor()}
+    params = {"Linear Regression": {}, "Decision Tree": {"criterion": ["not_a_criterion"]}}
+
+    report, early_stops = race_models(X_train, y_train, X_test, y_test, models, params, cv=3)
+
+    assert set(report) == {"Linear Regression"}
+    assert early_stops["Decision Tree"]["reason"] == "all configurations failed"
+    assert early_stops["Decision Tree"]["early_stopped_at_fold"] == 1
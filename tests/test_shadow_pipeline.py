@@ -0,0 +1,95 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.dummy import DummyRegressor
+from sklearn.preprocessing import FunctionTransformer
+
+from src.pipeline.shadow_pipeline import ShadowConfig, ShadowEvaluator
+from src.utils import save_object
+
+
+def _wait_for(evaluator, condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = evaluator.stats()
+        if condition(stats):
+            return stats
+        time.sleep(0.01)
+    pytest.fail(f"Shadow evaluator did not reach the expected state: {evaluator.stats()}")
+
+
+def _candidate(tmp_path, constant=10.0):
+    """Pickles a candidate that predicts a constant, behind an identity preprocessor"""
+    X = pd.DataFrame({"x": [0.0, 1.0]})
+    model = DummyRegressor(strategy="constant", constant=constant).fit(X, [0.0, 1.0])
+    preprocessor = FunctionTransformer().fit(X)
+    model_path = os.path.join(tmp_path, "candidate_model.pkl")
+    preprocessor_path = os.path.join(tmp_path, "candidate_preprocessor.pkl")
+    save_object(file_path=model_path, obj=model)
+    save_object(file_path=preprocessor_path, obj=preprocessor)
+    return model_path, preprocessor_path
+
+
+def _row(value=0.0):
+    return pd.DataFrame({"x": [value]})
+
+
+def test_failed_candidate_load_is_reported(tmp_path):
+    config = ShadowConfig(candidate_model_path=os.path.join(tmp_path, "missing.pkl"))
+    evaluator = ShadowEvaluator(config)
+
+    stats = _wait_for(evaluator, lambda s: s["candidate_loaded"] is not None)
+
+    assert stats["candidate_loaded"] is False
+    assert "missing.pkl" in stats["candidate_error"]
+    assert stats["scored"] == 0
+
+
+def test_submit_never_blocks_and_counts_drops_when_full(tmp_path):
+    # A failed load stops the worker, so nothing drains the queue
+    config = ShadowConfig(candidate_model_path=os.path.join(tmp_path, "missing.pkl"), max_queue_size=2)
+    evaluator = ShadowEvaluator(config)
+    _wait_for(evaluator, lambda s: s["candidate_loaded"] is False)
+
+    start = time.perf_counter()
+    accepted = [evaluator.submit(_row(), [1.0], 0.001) for _ in range(5)]
+    elapsed = time.perf_counter() - start
+
+    assert accepted == [True, True, False, False, False]
+    assert elapsed < 0.5
+    stats = evaluator.stats()
+    assert stats["dropped"] == 3
+    assert stats["queued"] == 2
+
+
+def test_inputs_are_batched_and_deltas_summarized(tmp_path):
+    model_path, preprocessor_path = _candidate(tmp_path, constant=10.0)
+    config = ShadowConfig(
+        candidate_model_path=model_path,
+        candidate_preprocessor_path=preprocessor_path,
+        batch_size=4,
+        flush_interval=5.0,
+    )
+    evaluator = ShadowEvaluator(config)
+
+    primary = [9.0, 12.0, 10.0, 14.0]
+    for i, pred in enumerate(primary):
+        assert evaluator.submit(_row(i), [pred], (i + 1) / 1000)
+
+    stats = _wait_for(evaluator, lambda s: s["scored"] == 4)
+
+    # Candidate predicts 10 for every row: deltas are 1, -2, 0, -4
+    assert stats["candidate_loaded"] is True
+    assert stats["candidate_error"] is None
+    assert stats["failed_batches"] == 0
+    assert stats["mean_delta"] == pytest.approx(-1.25)
+    assert stats["mean_abs_delta"] == pytest.approx(1.75)
+    assert stats["rmse_delta"] == pytest.approx(np.sqrt(5.25))
+    assert stats["max_abs_delta"] == pytest.approx(4.0)
+    # All four inputs arrived within flush_interval, so they were scored as one batch
+    assert stats["candidate_mean_batch_size"] == pytest.approx(4.0)
+    assert stats["primary_p50_ms"] == pytest.approx(2.5)
+    assert stats["candidate_per_row_ms"] > 0